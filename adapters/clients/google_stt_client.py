@@ -1,10 +1,16 @@
-import base64
+import binascii
+import functools
+import itertools
 import os
-from typing import Any, Dict
+import threading
+from typing import Any, Dict, Optional
 
 from google.api_core import exceptions as gcp_exceptions
 from google.cloud import speech
+from google.cloud.speech_v1.services.speech.transports import SpeechGrpcTransport
 
+from adapters.clients.proto_time import duration_seconds
+from core.domain.exceptions import STTValidationError
 from core.domain.stt_model import STTRequest, STTResponse, WordTimestamp
 from core.interfaces.google_stt_client_interface import GoogleSTTClientInterface
 
@@ -18,18 +24,84 @@ class GoogleSTTClient(GoogleSTTClientInterface):
         "amr": speech.RecognitionConfig.AudioEncoding.AMR,
         "amr_wb": speech.RecognitionConfig.AudioEncoding.AMR_WB,
     }
-
-    def __init__(self) -> None:
+    CHANNEL_OPTIONS = [
+        ("grpc.max_send_message_length", -1),
+        ("grpc.max_receive_message_length", -1),
+        ("grpc.use_local_subchannel_pool", 1),
+    ]
+    MIN_CONTAINER_AUDIO_BYTES = 400
+
+    def __init__(self, pool_size: Optional[int] = None) -> None:
         creds = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", "audio-engine-key.json")
         os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = creds
-        self.client = speech.SpeechClient()
+        if pool_size is None:
+            pool_size = int(
+                os.getenv("STT_CHANNEL_POOL_SIZE", min(8, os.cpu_count() or 1))
+            )
+        self.clients = [self._create_client() for _ in range(max(1, pool_size))]
+        self.client = self.clients[0]
+        self._client_cycle = itertools.cycle(self.clients)
+        self._client_lock = threading.Lock()
+
+    @classmethod
+    def _create_client(cls) -> speech.SpeechClient:
+        # Unlike streaming, where one shared channel multiplexes small audio
+        # frames, recognize() sends whole files in one message. Large uploads
+        # on a single HTTP/2 connection queue behind each other, so each
+        # pooled client gets its own connection through a local subchannel
+        # pool instead of sharing gRPC's process-wide one.
+        channel = SpeechGrpcTransport.create_channel(
+            f"{SpeechGrpcTransport.DEFAULT_HOST}:443", options=cls.CHANNEL_OPTIONS
+        )
+        return speech.SpeechClient(transport=SpeechGrpcTransport(channel=channel))
+
+    @classmethod
+    def _min_audio_bytes(cls, encoding: Any, sample_rate: int) -> int:
+        # LINEAR16 needs at least 50 ms of 16-bit mono samples; Opus containers
+        # need more than their headers to hold any audio frame.
+        if encoding == speech.RecognitionConfig.AudioEncoding.LINEAR16:
+            return sample_rate // 10
+        if encoding in (
+            speech.RecognitionConfig.AudioEncoding.WEBM_OPUS,
+            speech.RecognitionConfig.AudioEncoding.OGG_OPUS,
+        ):
+            return cls.MIN_CONTAINER_AUDIO_BYTES
+        return 1
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _make_config(
+        encoding: Any,
+        sample_rate: int,
+        language: str,
+        enable_automatic_punctuation: bool,
+        enable_word_timestamps: bool,
+        model: str,
+    ) -> speech.RecognitionConfig:
+        # Shared between requests with the same settings; never mutate it.
+        return speech.RecognitionConfig(
+            encoding=encoding,
+            sample_rate_hertz=sample_rate,
+            language_code=language,
+            enable_automatic_punctuation=enable_automatic_punctuation,
+            enable_word_time_offsets=enable_word_timestamps,
+            model=model,
+        )
+
+    def _next_client(self) -> speech.SpeechClient:
+        # Request threads share the cycle; the lock keeps next() serialized.
+        with self._client_lock:
+            return next(self._client_cycle)
 
     def transcribe_speech(self, request: STTRequest) -> STTResponse:
         try:
+            audio_data = request.audio_data
+            if isinstance(audio_data, str):
+                audio_data = binascii.a2b_base64(audio_data)
 
-            audio_data = base64.b64decode(request.audio_data)
-
-            encoding = self.FORMAT_MAPPING.get(request.format.lower())
+            encoding = self.FORMAT_MAPPING.get(
+                request.format
+            ) or self.FORMAT_MAPPING.get(request.format.lower())
             if not encoding:
                 return STTResponse(
                     transcription="",
@@ -38,18 +110,21 @@ class GoogleSTTClient(GoogleSTTClientInterface):
                     error_message=f"Unsupported audio format: {request.format}",
                 )
 
-            config = speech.RecognitionConfig(
-                encoding=encoding,
-                sample_rate_hertz=request.sample_rate,
-                language_code=request.language,
-                enable_automatic_punctuation=request.enable_automatic_punctuation,
-                enable_word_time_offsets=request.enable_word_timestamps,
-                model=request.model,
+            if len(audio_data) < self._min_audio_bytes(encoding, request.sample_rate):
+                raise STTValidationError("Audio too short")
+
+            config = self._make_config(
+                encoding,
+                request.sample_rate,
+                request.language,
+                request.enable_automatic_punctuation,
+                request.enable_word_timestamps,
+                request.model,
             )
 
             audio = speech.RecognitionAudio(content=audio_data)
 
-            response = self.client.recognize(config=config, audio=audio)
+            response = self._next_client().recognize(config=config, audio=audio)
 
             if response.results:
                 result = response.results[0]
@@ -58,15 +133,18 @@ class GoogleSTTClient(GoogleSTTClientInterface):
                 confidence = alternative.confidence or 0.0
 
                 word_timestamps = None
-                if request.enable_word_timestamps and hasattr(alternative, "words"):
-                    word_timestamps = [
-                        WordTimestamp(
-                            word=word.word,
-                            start_time=word.start_time.total_seconds(),
-                            end_time=word.end_time.total_seconds(),
-                        )
-                        for word in alternative.words
-                    ]
+                if request.enable_word_timestamps:
+                    # Raw protobuf Durations skip proto-plus' timedelta marshalling.
+                    words = speech.SpeechRecognitionAlternative.pb(alternative).words
+                    if words:
+                        word_timestamps = [
+                            WordTimestamp(
+                                word=word.word,
+                                start_time=duration_seconds(word.start_time),
+                                end_time=duration_seconds(word.end_time),
+                            )
+                            for word in words
+                        ]
 
                 return STTResponse(
                     transcription=transcription,
@@ -1,15 +1,45 @@
+import asyncio
+import functools
+import operator
 import queue
-import threading
-from typing import Any, Callable, Dict, Optional
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 from google.api_core import exceptions as gcp_exceptions
 from google.cloud import speech
+from google.cloud.speech_v1.services.speech import SpeechClient as SpeechGapicClient
 
+from adapters.clients.proto_time import duration_seconds
 from adapters.loggers.logger_adapter import app_logger
 from core.interfaces.google_stt_streaming_client_interface import (
     GoogleSTTStreamingClientInterface,
 )
 
+_STREAM_END = object()
+_word_fields = operator.attrgetter("word", "start_time", "end_time")
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_speech_client() -> speech.SpeechClient:
+    # All streams share this client's channel; see GoogleSTTClient for why
+    # unary recognize calls use a pool of channels instead.
+    return speech.SpeechClient()
+
+
+class _StreamCall:
+    # Lets the event loop cancel a gRPC call that an executor thread reads.
+    __slots__ = ("call", "abandoned")
+
+    def __init__(self) -> None:
+        self.call: Any = None
+        self.abandoned = False
+
+    def cancel(self) -> None:
+        self.abandoned = True
+        call = self.call
+        if call is not None:
+            call.cancel()
+
 
 class GoogleSTTStreamingClient(GoogleSTTStreamingClientInterface):
     FORMAT_MAPPING: Dict[str, Any] = {
@@ -23,27 +53,28 @@ class GoogleSTTStreamingClient(GoogleSTTStreamingClientInterface):
         "amr": speech.RecognitionConfig.AudioEncoding.AMR,
         "amr_wb": speech.RecognitionConfig.AudioEncoding.AMR_WB,
     }
+    AUDIO_BUFFER_SIZE = 16384
+    MAX_DRAIN = 2
+    INTERIM_COALESCE_SECONDS = 0.03
 
     def __init__(self) -> None:
-        self.client = speech.SpeechClient()
+        self.client = _shared_speech_client()
         self.config: Optional[speech.RecognitionConfig] = None
         self.streaming_config: Optional[speech.StreamingRecognitionConfig] = None
-        self.audio_queue: Optional[queue.Queue] = None
+        self._config_request: Optional[speech.StreamingRecognizeRequest] = None
+        self.audio_queue: Optional[queue.SimpleQueue] = None
+        self._audio_buffer = bytearray(self.AUDIO_BUFFER_SIZE)
         self.is_streaming = False
-        self._stop_event = threading.Event()
+        self._emit_words = False
+        # Nothing ever waits on the stop signal, so a plain flag replaces a
+        # threading.Event; attribute writes are atomic under the GIL.
+        self._stopped = False
 
     def setup_config(self, config_data: Dict[str, Any]) -> None:
-        encoding_str = config_data.get("encoding", "WEBM_OPUS").upper()
-        if encoding_str not in [
-            "WEBM_OPUS",
-            "LINEAR16",
-            "FLAC",
-            "OGG_OPUS",
-            "AMR",
-            "AMR_WB",
-        ]:
-            encoding_str = "WEBM_OPUS"
-        encoding = getattr(speech.RecognitionConfig.AudioEncoding, encoding_str)
+        encoding = self.FORMAT_MAPPING.get(
+            config_data.get("encoding", "webm_opus").lower(),
+            speech.RecognitionConfig.AudioEncoding.WEBM_OPUS,
+        )
 
         self.config = speech.RecognitionConfig(
             encoding=encoding,
@@ -60,27 +91,68 @@ class GoogleSTTStreamingClient(GoogleSTTStreamingClientInterface):
             config=self.config,
             interim_results=config_data.get("interimResults", True),
             single_utterance=config_data.get("singleUtterance", False),
+            **self._voice_activity_options(config_data),
+        )
+        self._emit_words = self.config.enable_word_time_offsets
+        self._config_request = speech.StreamingRecognizeRequest(
+            streaming_config=self.streaming_config
         )
 
-        self.audio_queue = queue.Queue()
-        self._stop_event.clear()
+        self.audio_queue = queue.SimpleQueue()
+        self._audio_buffer = bytearray(self.AUDIO_BUFFER_SIZE)
+        self._stopped = False
         app_logger.info("STT streaming configuration setup completed")
 
+    @staticmethod
+    def _voice_activity_options(config_data: Dict[str, Any]) -> Dict[str, Any]:
+        # Either timeout firing ends the whole streaming call in v1, not just
+        # the current utterance; the controller reports it as stream_ended.
+        speech_start_timeout_ms = config_data.get("speechStartTimeoutMs")
+        speech_end_timeout_ms = config_data.get("speechEndTimeoutMs")
+        if speech_start_timeout_ms is None and speech_end_timeout_ms is None:
+            return {}
+
+        timeout = speech.StreamingRecognitionConfig.VoiceActivityTimeout()
+        if speech_start_timeout_ms is not None:
+            timeout.speech_start_timeout = timedelta(
+                milliseconds=speech_start_timeout_ms
+            )
+        if speech_end_timeout_ms is not None:
+            timeout.speech_end_timeout = timedelta(milliseconds=speech_end_timeout_ms)
+        return {
+            "enable_voice_activity_events": True,
+            "voice_activity_timeout": timeout,
+        }
+
     def add_audio_chunk(self, audio_data: bytes) -> None:
-        if self.audio_queue and not self._stop_event.is_set():
+        if self.audio_queue is not None and not self._stopped:
             self.audio_queue.put(audio_data)
 
-    def _audio_generator(self):
-        while not self._stop_event.is_set():
-            try:
-                chunk = self.audio_queue.get(timeout=0.1)
+    def _audio_generator(self, audio_queue: queue.SimpleQueue, buffer: bytearray):
+        # Up to MAX_DRAIN chunks that queued up while the previous request was
+        # in flight are coalesced into one reusable buffer, so each yield costs
+        # a single copy without sending oversized bursts. qsize() bounds the
+        # drain up front; with a single consumer get_nowait() cannot come up
+        # empty, so no queue.Empty is raised per yield.
+        # The blocking get() wakes only on audio or on the None sentinel that
+        # stop_streaming() and start_streaming() enqueue on shutdown.
+        max_extra = self.MAX_DRAIN - 1
+        while True:
+            chunk = audio_queue.get()
+            if chunk is None:
+                break
+
+            size = len(chunk)
+            buffer[:size] = chunk
+            for _ in range(min(audio_queue.qsize(), max_extra)):
+                chunk = audio_queue.get_nowait()
                 if chunk is None:
                     break
-                yield chunk
-            except queue.Empty:
-                continue
-            except Exception as e:
-                app_logger.error("Error in audio generator: %s", e)
+                buffer[size : size + len(chunk)] = chunk
+                size += len(chunk)
+
+            yield bytes(memoryview(buffer)[:size])
+            if chunk is None:
                 break
 
     async def start_streaming(
@@ -88,72 +160,200 @@ class GoogleSTTStreamingClient(GoogleSTTStreamingClientInterface):
     ) -> None:
         if not self.config or not self.streaming_config:
             raise ValueError("Configuration not set. Call setup_config() first.")
+        # setup_config() installs a fresh queue and buffer on reconfigure, so
+        # this call keeps its own and only tears down the stream it started.
+        audio_queue = self.audio_queue
+        audio_buffer = self._audio_buffer
+        config_request = self._config_request
         self.is_streaming = True
 
         def request_generator():
-
-            for audio_chunk in self._audio_generator():
-                yield speech.StreamingRecognizeRequest(audio_content=audio_chunk)
+            yield config_request
+            # gRPC serializes each request before pulling the next one, so a
+            # single message is recycled instead of building one per chunk.
+            # Writing the raw protobuf field skips proto-plus marshalling.
+            request = speech.StreamingRecognizeRequest()
+            request_pb = speech.StreamingRecognizeRequest.pb(request)
+            for audio_chunk in self._audio_generator(audio_queue, audio_buffer):
+                request_pb.audio_content = audio_chunk
+                yield request
 
         app_logger.info("Starting STT streaming recognition")
 
-        responses = self.client.streaming_recognize(
-            self.streaming_config, request_generator()
+        # Opening the stream and reading its responses both block, so both run
+        # on an executor thread: a slow result callback cannot stall gRPC and
+        # gRPC cannot stall the loop.
+        loop = asyncio.get_running_loop()
+        results: asyncio.Queue = asyncio.Queue()
+        stream_call = _StreamCall()
+        pump = loop.run_in_executor(
+            None,
+            self._pump_responses,
+            request_generator(),
+            loop,
+            results,
+            stream_call,
         )
 
+        # Interim results arriving within INTERIM_COALESCE_SECONDS of each
+        # other collapse into the latest one; a final supersedes it outright.
+        pending = None
+        deadline = 0.0
         try:
-            for response in responses:
-                if self._stop_event.is_set():
-                    break
+            while True:
+                if pending is None:
+                    payload = await results.get()
+                else:
+                    try:
+                        payload = await asyncio.wait_for(
+                            results.get(), deadline - loop.time()
+                        )
+                    except asyncio.TimeoutError:
+                        result_callback(pending)
+                        pending = None
+                        continue
 
-                if (
-                    getattr(response, "speech_event_type", None)
-                    == speech.StreamingRecognizeResponse.SpeechEventType.END_OF_SINGLE_UTTERANCE
-                ):
-                    await result_callback({"type": "end_of_utterance"})
+                if payload is _STREAM_END:
+                    break
+                if payload["type"] == "interim_result":
+                    if pending is None:
+                        deadline = loop.time() + self.INTERIM_COALESCE_SECONDS
+                    pending = payload
                     continue
+                if pending is not None and payload["type"] != "final_result":
+                    result_callback(pending)
+                pending = None
+                result_callback(payload)
 
-                for result in response.results:
-                    if not result.alternatives:
-                        continue
-                    alt = result.alternatives[0]
-                    ts = None
-                    if hasattr(alt, "words") and alt.words:
-                        ts = [
-                            {
-                                "word": w.word,
-                                "startTime": w.start_time.total_seconds(),
-                                "endTime": w.end_time.total_seconds(),
-                            }
-                            for w in alt.words
-                        ]
-                    payload = {
-                        "type": "final_result" if result.is_final else "interim_result",
-                        "transcript": alt.transcript,
-                        "confidence": getattr(alt, "confidence", 0.0),
-                    }
-                    if result.is_final:
-                        payload["wordTimestamps"] = ts
-                    await result_callback(payload)
+            if pending is not None:
+                result_callback(pending)
+            await pump
+        except asyncio.CancelledError:
+            # Cancelling this task does not stop the executor thread, so the
+            # call is closed and the pump awaited; callers treat the task's
+            # end as the moment its thread is free again.
+            stream_call.cancel()
+            audio_queue.put(None)
+            await asyncio.shield(pump)
+            raise
+        finally:
+            # Google can end the call on its own (voice activity timeout,
+            # duration limit, API error); ingestion stops with it so frames
+            # are not queued for a stream that no longer reads them.
+            if self.audio_queue is audio_queue:
+                self.is_streaming = False
+                self._stopped = True
+            audio_queue.put(None)
+            app_logger.info("STT streaming recognition stopped")
 
+    def _pump_responses(
+        self,
+        requests: Iterable[speech.StreamingRecognizeRequest],
+        loop: asyncio.AbstractEventLoop,
+        results: asyncio.Queue,
+        stream_call: _StreamCall,
+    ) -> None:
+        process_response = self._process_response
+        publish = loop.call_soon_threadsafe
+        put = results.put_nowait
+        try:
+            # Opening the stream blocks until Google sends the first response,
+            # so it happens here rather than on the shared event loop. The
+            # SpeechHelpers wrapper is bypassed because it would rebuild the
+            # config request that setup_config() already prepared.
+            responses = SpeechGapicClient.streaming_recognize(
+                self.client, requests=requests
+            )
+            stream_call.call = responses
+            if stream_call.abandoned:
+                responses.cancel()
+            for response in responses:
+                if self._stopped or stream_call.abandoned:
+                    break
+                for payload in process_response(response):
+                    publish(put, payload)
         except gcp_exceptions.GoogleAPICallError as e:
+            if stream_call.abandoned:
+                app_logger.debug("Streaming call cancelled: %s", e)
+                return
             app_logger.error("Google API error during streaming: %s", e)
-            await result_callback(
-                {"type": "error", "message": f"Google API error: {e}"}
+            self._publish(
+                loop, results, {"type": "error", "message": f"Google API error: {e}"}
             )
         except Exception as e:
             app_logger.error("Unexpected error during streaming: %s", e)
-            await result_callback({"type": "error", "message": f"Streaming error: {e}"})
+            self._publish(
+                loop, results, {"type": "error", "message": f"Streaming error: {e}"}
+            )
         finally:
-            self.is_streaming = False
-            app_logger.info("STT streaming recognition stopped")
+            self._publish(loop, results, _STREAM_END)
+
+    @staticmethod
+    def _publish(
+        loop: asyncio.AbstractEventLoop, results: asyncio.Queue, item: Any
+    ) -> None:
+        try:
+            loop.call_soon_threadsafe(results.put_nowait, item)
+        except RuntimeError:
+            app_logger.debug("Dropping streaming result: event loop is closed")
+
+    def _process_response(
+        self, response: speech.StreamingRecognizeResponse
+    ) -> List[Dict[str, Any]]:
+        if (
+            response.speech_event_type
+            == speech.StreamingRecognizeResponse.SpeechEventType.END_OF_SINGLE_UTTERANCE
+        ):
+            return [{"type": "end_of_utterance"}]
+
+        payloads = []
+        for result in response.results:
+            if not result.alternatives:
+                continue
+            if result.is_final:
+                payloads.append(self._final_payload(result.alternatives[0]))
+            else:
+                payloads.append(self._interim_payload(result.alternatives[0]))
+        return payloads
+
+    @staticmethod
+    def _interim_payload(alt: speech.SpeechRecognitionAlternative) -> Dict[str, Any]:
+        return {
+            "type": "interim_result",
+            "transcript": alt.transcript,
+            "confidence": alt.confidence,
+        }
+
+    def _final_payload(
+        self, alt: speech.SpeechRecognitionAlternative
+    ) -> Dict[str, Any]:
+        ts = None
+        words = self._emit_words and speech.SpeechRecognitionAlternative.pb(alt).words
+        if words:
+            ts = [
+                {
+                    "word": word,
+                    "startTime": duration_seconds(start),
+                    "endTime": duration_seconds(end),
+                }
+                for word, start, end in map(_word_fields, words)
+            ]
+        return {
+            "type": "final_result",
+            "transcript": alt.transcript,
+            "confidence": alt.confidence,
+            "wordTimestamps": ts,
+        }
 
     def stop_streaming(self) -> None:
         app_logger.info("Stopping STT streaming recognition")
-        self._stop_event.set()
-        if self.audio_queue:
+        self._stopped = True
+        if self.audio_queue is not None:
             self.audio_queue.put(None)
         self.is_streaming = False
 
     def is_active(self) -> bool:
-        return self.is_streaming and not self._stop_event.is_set()
+        return self.is_streaming and not self._stopped
+
+    def is_ingesting(self) -> bool:
+        return self.audio_queue is not None and not self._stopped
@@ -1,43 +1,42 @@
-import base64
+import functools
 import os
+import re
+from typing import Iterator
 
 from google.api_core import exceptions as gcp_exceptions
 from google.cloud import texttospeech
 
-from core.domain.tts_model import TTSRequest, TTSResponse
+from core.domain.exceptions import TTSProcessingError
+from core.domain.tts_model import TTSRequest, TTSResponse, VoiceConfig
 from core.interfaces.google_tts_client_interface import GoogleTTSClientInterface
 
 
+@functools.lru_cache(maxsize=None)
+def _shared_tts_client() -> texttospeech.TextToSpeechClient:
+    # gRPC clients are thread-safe, so every request thread shares one channel.
+    return texttospeech.TextToSpeechClient()
+
+
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?;])\s+")
+
+
 class GoogleTTSClient(GoogleTTSClientInterface):
     def __init__(self) -> None:
         creds = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", "audio-engine-key.json")
         os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = creds
-        self.client = texttospeech.TextToSpeechClient()
+        self.client = _shared_tts_client()
 
     def synthesize_speech(self, request: TTSRequest) -> TTSResponse:
         try:
             synthesis_input = texttospeech.SynthesisInput(text=request.text)
 
-            voice = texttospeech.VoiceSelectionParams(
-                language_code=request.voice_config.language_code,
-                name=request.voice_config.name,
-                ssml_gender=getattr(
-                    texttospeech.SsmlVoiceGender, request.voice_config.ssml_gender
-                ),
-            )
-
-            audio_config = texttospeech.AudioConfig(
-                audio_encoding=texttospeech.AudioEncoding.MP3,
-                speaking_rate=request.voice_config.speaking_rate,
-                pitch=request.voice_config.pitch,
-            )
-
             response = self.client.synthesize_speech(
-                input=synthesis_input, voice=voice, audio_config=audio_config
+                input=synthesis_input,
+                voice=self._voice_params(request.voice_config),
+                audio_config=self._audio_config(request.voice_config),
             )
 
-            audio_b64 = base64.b64encode(response.audio_content).decode("utf-8")
-            return TTSResponse(audio_content=audio_b64, success=True)
+            return TTSResponse(audio_content=response.audio_content, success=True)
 
         except (
             gcp_exceptions.GoogleAPICallError,
@@ -45,14 +44,49 @@ class GoogleTTSClient(GoogleTTSClientInterface):
             AttributeError,
         ) as e:
             return TTSResponse(
-                audio_content="",
+                audio_content=b"",
                 success=False,
                 error_message=f"TTS synthesis failed: {str(e)}",
             )
         except (OSError, IOError, RuntimeError) as system_error:
 
             return TTSResponse(
-                audio_content="",
+                audio_content=b"",
                 success=False,
                 error_message=f"System error during TTS synthesis: {str(system_error)}",
             )
+
+    def synthesize_speech_stream(self, request: TTSRequest) -> Iterator[bytes]:
+        # The v1 API has no streaming synthesis, so the text is synthesized a
+        # sentence at a time; MP3 frames from consecutive calls concatenate
+        # into one playable stream and the first sentence arrives early.
+        voice = self._voice_params(request.voice_config)
+        audio_config = self._audio_config(request.voice_config)
+        for sentence in _SENTENCE_BREAK.split(request.text.strip()):
+            if not sentence:
+                continue
+            try:
+                response = self.client.synthesize_speech(
+                    input=texttospeech.SynthesisInput(text=sentence),
+                    voice=voice,
+                    audio_config=audio_config,
+                )
+            except gcp_exceptions.GoogleAPICallError as e:
+                raise TTSProcessingError(f"TTS synthesis failed: {str(e)}") from e
+            yield response.audio_content
+
+    @staticmethod
+    def _voice_params(voice_config: VoiceConfig) -> texttospeech.VoiceSelectionParams:
+        return texttospeech.VoiceSelectionParams(
+            language_code=voice_config.language_code,
+            name=voice_config.name,
+            ssml_gender=getattr(texttospeech.SsmlVoiceGender, voice_config.ssml_gender),
+        )
+
+    @staticmethod
+    def _audio_config(voice_config: VoiceConfig) -> texttospeech.AudioConfig:
+        return texttospeech.AudioConfig(
+            audio_encoding=texttospeech.AudioEncoding.MP3,
+            speaking_rate=voice_config.speaking_rate,
+            pitch=voice_config.pitch,
+        )
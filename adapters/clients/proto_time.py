@@ -0,0 +1,6 @@
+from google.protobuf.duration_pb2 import Duration
+
+
+def duration_seconds(duration: Duration) -> float:
+    # Dividing by the exact 1e9 rounds once, unlike multiplying by 1e-9.
+    return duration.seconds + duration.nanos / 1e9
@@ -0,0 +1,110 @@
+import math
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from marshmallow import Schema, ValidationError, fields, missing
+
+_NATIVE_TYPES = {
+    fields.String: str,
+    fields.Integer: int,
+    fields.Boolean: bool,
+}
+
+_FastField = Tuple[fields.Field, Callable[[Any], bool], Optional[Callable[[Any], Any]]]
+
+
+class FastLoadSchema(Schema):
+    # Field checks are specialized once per schema instance. Payloads whose
+    # values already have the exact native type are loaded with plain dict
+    # lookups; anything else, including every error, goes through marshmallow
+    # so messages and coercions stay unchanged.
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._fast_fields = self._compile_fast_fields()
+
+    def _compile_fast_fields(self) -> Optional[Dict[str, _FastField]]:
+        if self.many or self.opts.ordered or any(self._hooks.values()):
+            return None
+
+        compiled = {}
+        for name, field in self.load_fields.items():
+            if field.data_key not in (None, name) or field.attribute not in (
+                None,
+                name,
+            ):
+                return None
+            check = self._compile_field(field)
+            if check is None:
+                return None
+            compiled[name] = (field, *check)
+        return compiled
+
+    @staticmethod
+    def _compile_field(
+        field: fields.Field,
+    ) -> Optional[Tuple[Callable[[Any], bool], Optional[Callable[[Any], Any]]]]:
+        field_type = type(field)
+        if field_type is fields.Raw:
+            return (lambda value: True), None
+        native = _NATIVE_TYPES.get(field_type)
+        if native is not None:
+            return (lambda value: type(value) is native), None
+        if field_type is fields.Float:
+            # Float rejects NaN and infinities unless allow_nan is set; those
+            # take the marshmallow path so the error is unchanged.
+            if field.allow_nan:
+                return (lambda value: type(value) is float), None
+            return (lambda value: type(value) is float and math.isfinite(value)), None
+        if (
+            field_type is fields.Dict
+            and type(field.key_field) in (type(None), fields.String)
+            and type(field.value_field) in (type(None), fields.Raw)
+            and not (field.key_field and field.key_field.validators)
+        ):
+            return (
+                lambda value: type(value) is dict
+                and all(type(key) is str for key in value)
+            ), dict
+        return None
+
+    def load(self, data, *, many=None, partial=None, unknown=None):
+        if (
+            self._fast_fields is not None
+            and many is None
+            and partial is None
+            and unknown is None
+            and type(data) is dict
+        ):
+            result = self._fast_load(data)
+            if result is not None:
+                return result
+        return super().load(data, many=many, partial=partial, unknown=unknown)
+
+    def _fast_load(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        compiled = self._fast_fields
+        if not data.keys() <= compiled.keys():
+            return None
+
+        result = {}
+        for name, (field, accepts, convert) in compiled.items():
+            value = data.get(name, missing)
+            if value is missing:
+                if field.required:
+                    return None
+                default = field.load_default
+                if default is not missing:
+                    result[name] = default() if callable(default) else default
+                continue
+
+            if not accepts(value):
+                return None
+            if convert is not None:
+                value = convert(value)
+            try:
+                for validator in field.validators:
+                    if validator(value) is False:
+                        return None
+            except ValidationError:
+                return None
+            result[name] = value
+        return result
@@ -1,17 +1,18 @@
-from typing import Any, Dict, Tuple
+from typing import Any, Callable, Dict, Tuple, Union
 
 from flask import Blueprint, request
-from marshmallow import Schema, ValidationError, fields
+from marshmallow import ValidationError, fields
 
+from adapters.controllers.fast_schema import FastLoadSchema
 from adapters.loggers.logger_adapter import app_logger
 from app.api_response import ApiResponse
+from core.domain.exceptions import STTValidationError
 from core.domain.stt_model import STTRequest
 from core.interfaces.stt_controller_interface import STTControllerInterface
 from usecases.transcribe_speech_use_case import TranscribeSpeechUseCase
 
 
-class STTRequestSchema(Schema):
-    audio_data = fields.String(required=True, validate=fields.Length(min=1))
+class STTMetadataSchema(FastLoadSchema):
     format = fields.String(missing="webm")
     language = fields.String(missing="en-US")
     enable_word_timestamps = fields.Boolean(missing=False)
@@ -20,26 +21,56 @@ class STTRequestSchema(Schema):
     model = fields.String(missing="latest_long")
 
 
+class STTRequestSchema(STTMetadataSchema):
+    audio_data = fields.String(required=True, validate=fields.Length(min=1))
+
+
 class STTController(STTControllerInterface):
     def __init__(self, use_case: TranscribeSpeechUseCase) -> None:
         self.use_case = use_case
+        self.schema = STTRequestSchema()
+        self.metadata_schema = STTMetadataSchema()
 
     def transcribe_speech(self) -> Tuple[Dict[str, Any], int]:
+        return self._transcribe(self._json_request)
+
+    def transcribe_upload(self) -> Tuple[Dict[str, Any], int]:
+        return self._transcribe(self._upload_request)
+
+    def _json_request(self) -> STTRequest:
+        data = request.get_json() or {}
+        validated_data = self.schema.load(data)
+        return self._build_request(validated_data["audio_data"], validated_data)
+
+    def _upload_request(self) -> STTRequest:
+        # Raw audio in a multipart file part skips base64 on the wire and the
+        # decode step before recognition.
+        audio_file = request.files.get("audio")
+        audio_data = audio_file.read() if audio_file is not None else b""
+        if not audio_data:
+            raise ValidationError({"audio": ["Missing or empty audio file."]})
+        validated_data = self.metadata_schema.load(request.form.to_dict())
+        return self._build_request(audio_data, validated_data)
+
+    @staticmethod
+    def _build_request(
+        audio_data: Union[str, bytes], validated_data: Dict[str, Any]
+    ) -> STTRequest:
+        return STTRequest(
+            audio_data=audio_data,
+            format=validated_data["format"],
+            language=validated_data["language"],
+            enable_word_timestamps=validated_data["enable_word_timestamps"],
+            sample_rate=validated_data["sample_rate"],
+            enable_automatic_punctuation=validated_data["enable_automatic_punctuation"],
+            model=validated_data["model"],
+        )
+
+    def _transcribe(
+        self, build_request: Callable[[], STTRequest]
+    ) -> Tuple[Dict[str, Any], int]:
         try:
-            data = request.get_json() or {}
-            validated_data = STTRequestSchema().load(data)
-
-            stt_request = STTRequest(
-                audio_data=validated_data["audio_data"],
-                format=validated_data["format"],
-                language=validated_data["language"],
-                enable_word_timestamps=validated_data["enable_word_timestamps"],
-                sample_rate=validated_data["sample_rate"],
-                enable_automatic_punctuation=validated_data[
-                    "enable_automatic_punctuation"
-                ],
-                model=validated_data["model"],
-            )
+            stt_request = build_request()
 
             response = self.use_case.execute(stt_request)
 
@@ -79,6 +110,10 @@ class STTController(STTControllerInterface):
                 400,
             )
 
+        except STTValidationError as stt_error:
+            app_logger.error("STT request rejected: %s", stt_error.message)
+            return ApiResponse.error(stt_error.message), 400
+
         except RuntimeError as runtime_error:
             app_logger.error("Runtime error: %s", str(runtime_error), exc_info=True)
             return ApiResponse.error("Internal server error"), 500
@@ -98,4 +133,8 @@ def create_stt_blueprint(use_case: TranscribeSpeechUseCase) -> Blueprint:
     def transcribe():
         return controller.transcribe_speech()
 
+    @blueprint.route("/upload", methods=["POST"])
+    def transcribe_upload():
+        return controller.transcribe_upload()
+
     return blueprint
@@ -1,16 +1,64 @@
+import asyncio
+import concurrent.futures
+import os
 import threading
-from typing import Any, Dict
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 from flask import Blueprint, request
 from flask_socketio import SocketIO, emit
-from marshmallow import Schema, ValidationError, fields
+from marshmallow import ValidationError, fields, validate
 
+from adapters.controllers.fast_schema import FastLoadSchema
 from adapters.loggers.logger_adapter import app_logger
 from core.interfaces.stt_controller_interface import STTControllerInterface
 from usecases.stt_streaming_use_case import STTStreamingUseCase
 
-
-class STTStreamingConfigSchema(Schema):
+# Fixed event payloads are built once; Socket.IO only reads them.
+_CONNECTED_PAYLOAD = {"status": "connected", "message": "Ready for streaming"}
+_CONFIGURED_PAYLOAD = {"status": "success", "message": "Streaming configured"}
+_STOPPED_PAYLOAD = {"status": "stopped", "message": "Streaming stopped"}
+_NO_SESSION_PAYLOAD = {"status": "error", "message": "No active session found"}
+_NOT_CONFIGURED_PAYLOAD = {"status": "error", "message": "Session not configured"}
+_NO_AUDIO_PAYLOAD = {"status": "error", "message": "No audio data received"}
+_STREAM_ENDED_PAYLOAD = {
+    "type": "stream_ended",
+    "status": "stopped",
+    "message": "Streaming ended, send config to start again",
+}
+_AT_CAPACITY_PAYLOAD = {
+    "status": "error",
+    "message": "Too many active streams, try again later",
+}
+
+# A streaming recognize session is capped at about five minutes of audio, so
+# longer voice activity timeouts could never fire.
+_MAX_VOICE_TIMEOUT_MS = 300_000
+
+
+@dataclass(slots=True)
+class _StreamSlot:
+    started: bool = False
+    released: bool = False
+    freed: threading.Event = field(default_factory=threading.Event)
+
+
+@dataclass(slots=True)
+class StreamingSession:
+    configured: bool = False
+    streaming: bool = False
+    future: Optional[concurrent.futures.Future] = None
+    slot: Optional[_StreamSlot] = None
+    error_tokens: float = 0.0
+    error_refilled_at: float = 0.0
+    suppressed_errors: int = 0
+
+
+ResultCallback = Callable[[Dict[str, Any]], None]
+
+
+class STTStreamingConfigSchema(FastLoadSchema):
     encoding = fields.String(missing="WEBM_OPUS")
     sampleRateHertz = fields.Integer(missing=48000)
     languageCode = fields.String(missing="en-US")
@@ -20,147 +68,192 @@ class STTStreamingConfigSchema(Schema):
     maxAlternatives = fields.Integer(missing=1)
     enableAutomaticPunctuation = fields.Boolean(missing=True)
     model = fields.String(missing="latest_long")
+    speechStartTimeoutMs = fields.Integer(
+        missing=None, validate=validate.Range(min=0, max=_MAX_VOICE_TIMEOUT_MS)
+    )
+    speechEndTimeoutMs = fields.Integer(
+        missing=None, validate=validate.Range(min=0, max=_MAX_VOICE_TIMEOUT_MS)
+    )
 
 
 class STTStreamingController(STTControllerInterface):
-    def __init__(self, socketio: SocketIO, use_case: STTStreamingUseCase) -> None:
+    ERROR_EMIT_RATE = 5.0
+    ERROR_EMIT_BURST = 5.0
+    STREAM_RELEASE_TIMEOUT = 2.0
+
+    def __init__(
+        self,
+        socketio: SocketIO,
+        use_case: STTStreamingUseCase,
+        max_streams: Optional[int] = None,
+    ) -> None:
         self.socketio = socketio
         self.use_case = use_case
-        self.active_sessions: Dict[str, Dict[str, Any]] = {}
+        self.active_sessions: Dict[str, StreamingSession] = {}
+        self._sessions_lock = threading.RLock()
         self.schema = STTStreamingConfigSchema()
         self.logger = app_logger
+        # All sessions share one long-lived event loop instead of a thread
+        # and a fresh loop per configured stream.
+        self._loop = asyncio.new_event_loop()
+        # Each stream holds one executor thread for its response pump, so the
+        # pool size caps concurrent streams and its threads are reused.
+        if max_streams is None:
+            max_streams = int(os.getenv("STT_MAX_STREAMS", "32"))
+        self._max_streams = max(1, max_streams)
+        self._active_streams = 0
+        self._loop.set_default_executor(
+            concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._max_streams, thread_name_prefix="stt-stream"
+            )
+        )
+        threading.Thread(
+            target=self._loop.run_forever, name="stt-streaming-loop", daemon=True
+        ).start()
         self._register_handlers()
 
     def _register_handlers(self) -> None:
+        for event, handler in (
+            ("connect", self._on_connect),
+            ("disconnect", self._on_disconnect),
+            ("config", self._on_config),
+            ("audio", self._on_audio),
+            ("stop", self._on_stop),
+        ):
+            self.socketio.on_event(event, handler, namespace="/api/stt/stream")
 
-        @self.socketio.on("connect", namespace="/api/stt/stream")
-        def handle_connect(auth=None):
-            client_id = self._get_client_id()
-            self.logger.info("STT streaming client connected: %s", client_id)
+    def _on_connect(self, auth: Optional[Dict[str, Any]] = None) -> None:
+        client_id = self._get_client_id()
+        self.logger.info("STT streaming client connected: %s", client_id)
 
-            self.active_sessions[client_id] = {"configured": False, "streaming": False}
+        with self._sessions_lock:
+            self.active_sessions[client_id] = StreamingSession()
 
-            emit("connected", {"status": "connected", "message": "Ready for streaming"})
+        emit("connected", _CONNECTED_PAYLOAD)
 
-        @self.socketio.on("disconnect", namespace="/api/stt/stream")
-        def handle_disconnect():
-            try:
-                client_id = self._get_client_id()
+    def _on_disconnect(self) -> None:
+        client_id = self._get_client_id()
+        with self._sessions_lock:
+            session = self.active_sessions.pop(client_id, None)
 
-                if client_id in self.active_sessions:
+        if session is not None:
 
-                    self.use_case.stop_streaming()
+            self.use_case.stop_streaming()
+            self._cancel_streaming(session)
 
-                    del self.active_sessions[client_id]
-                    self.logger.info(
-                        f"Client {client_id} disconnected and session cleaned up"
-                    )
-                else:
-                    self.logger.info(
-                        f"Client {client_id} disconnected (no active session)"
-                    )
+            self.logger.info("Client %s disconnected and session cleaned up", client_id)
+        else:
+            self.logger.info("Client %s disconnected (no active session)", client_id)
 
-            except Exception as e:
-                self.logger.error(f"Error handling disconnect: {str(e)}")
+    def _on_config(self, data: Dict[str, Any]) -> None:
+        client_id = self._get_client_id()
 
-                try:
-                    client_id = self._get_client_id()
-                    if client_id in self.active_sessions:
-                        del self.active_sessions[client_id]
-                except Exception:
-                    pass
-
-        @self.socketio.on("config", namespace="/api/stt/stream")
-        def handle_config(data):
-            client_id = self._get_client_id()
-
-            try:
-
-                config_data = self.schema.load(data.get("config", {}))
-
-                self.use_case.execute(config_data)
-
-                if client_id in self.active_sessions:
-                    self.active_sessions[client_id]["configured"] = True
-
-                    def result_callback(result: Dict[str, Any]) -> None:
-                        try:
-                            event_type = result.get("type", "result")
-
-                            self.socketio.emit(
-                                event_type,
-                                result,
-                                room=client_id,
-                                namespace="/api/stt/stream",
-                            )
-                        except Exception as e:
-                            self.logger.error(
-                                f"Error sending result to client {client_id}: {str(e)}"
-                            )
-
-                    threading.Thread(
-                        target=self._start_streaming_thread,
-                        args=(client_id, result_callback),
-                        daemon=True,
-                    ).start()
-
-                    self.logger.info(
-                        f"Client {client_id} configured and streaming started"
-                    )
-                    emit(
-                        "configured",
-                        {"status": "success", "message": "Streaming configured"},
-                    )
+        try:
 
-            except ValidationError as e:
-                self.logger.error(f"Configuration validation error: {e.messages}")
-                emit(
-                    "error",
-                    {
-                        "status": "error",
-                        "message": "Invalid configuration",
-                        "errors": e.messages,
-                    },
-                )
-            except Exception as e:
-                self.logger.error(f"Configuration error: {str(e)}")
-                emit("error", {"status": "error", "message": str(e)})
-
-        @self.socketio.on("audio", namespace="/api/stt/stream")
-        def handle_audio(data):
-            client_id = self._get_client_id()
-
-            try:
-                if client_id not in self.active_sessions:
-                    emit(
-                        "error",
-                        {"status": "error", "message": "No active session found"},
-                    )
-                    return
+            config_data = self.schema.load(data.get("config", {}))
 
-                if not self.active_sessions[client_id].get("configured"):
-                    emit(
-                        "error",
-                        {"status": "error", "message": "Session not configured"},
-                    )
+            # A second config on a live session replaces its stream. The old one
+            # is stopped before execute() installs the new configuration.
+            with self._sessions_lock:
+                previous = self.active_sessions.get(client_id)
+            if previous is not None and self._is_streaming(previous):
+                self.use_case.stop_streaming()
+                self._cancel_streaming(previous)
+                # The replacement needs the old stream's slot, which frees up
+                # once its executor thread has closed the gRPC call.
+                if previous.slot is not None:
+                    previous.slot.freed.wait(self.STREAM_RELEASE_TIMEOUT)
+
+            self.use_case.execute(config_data)
+
+            with self._sessions_lock:
+                session = self.active_sessions.get(client_id)
+                if session is not None:
+                    session.configured = True
+
+            if session is not None:
+
+                def result_callback(result: Dict[str, Any]) -> None:
+                    try:
+                        event_type = result.get("type", "result")
+
+                        self.socketio.emit(
+                            event_type,
+                            result,
+                            room=client_id,
+                            namespace="/api/stt/stream",
+                        )
+                    except Exception as e:
+                        self.logger.error(
+                            "Error sending result to client %s: %s", client_id, e
+                        )
+
+                if not self._start_streaming(client_id, result_callback):
                     return
 
+                self.logger.info(
+                    "Client %s configured and streaming started", client_id
+                )
+                emit("configured", _CONFIGURED_PAYLOAD)
+
+        except ValidationError as e:
+            self.logger.error("Configuration validation error: %s", e.messages)
+            emit(
+                "error",
+                {
+                    "status": "error",
+                    "message": "Invalid configuration",
+                    "errors": e.messages,
+                },
+            )
+        except (AttributeError, TypeError, ValueError, RuntimeError) as e:
+            self.logger.error("Configuration error: %s", e)
+            emit("error", {"status": "error", "message": str(e)})
+
+    def _on_audio(self, data: Union[bytes, bytearray, Dict[str, Any]]) -> None:
+        # Socket.IO always dispatches events inside a request context, so
+        # the per-frame path reads the sid directly.
+        client_id: str = request.sid
+        session = self.active_sessions.get(client_id)
+
+        try:
+            if session is None:
+                emit("error", _NO_SESSION_PAYLOAD)
+                return
+
+            if not session.configured:
+                self._emit_audio_error(session, _NOT_CONFIGURED_PAYLOAD)
+                return
+
+            # Frames sent after stop would only be dropped by the client.
+            if not self.use_case.is_ingesting():
+                return
+
+            # Binary frames arrive as bytes and are queued as-is; JSON
+            # integer arrays are still accepted but cost a conversion.
+            if isinstance(data, (bytes, bytearray)):
+                audio_data = data
+            else:
                 audio_data = data.get("data")
-                if not audio_data:
-                    emit(
-                        "error",
-                        {"status": "error", "message": "No audio data received"},
-                    )
-                    return
+            if not audio_data:
+                self._emit_audio_error(session, _NO_AUDIO_PAYLOAD)
+                return
 
+            if isinstance(audio_data, (bytes, bytearray)):
+                audio_bytes = audio_data
+            else:
                 try:
-                    if isinstance(audio_data, list):
-                        audio_bytes = bytes(audio_data)
-                    else:
-                        audio_bytes = audio_data
-                except Exception as e:
-                    emit(
-                        "error",
+                    # bytes(n) would allocate n zero bytes, so only integer
+                    # lists are converted.
+                    if not isinstance(audio_data, list):
+                        raise TypeError(
+                            "expected a list of ints, "
+                            f"got {type(audio_data).__name__}"
+                        )
+                    audio_bytes = bytes(audio_data)
+                except (TypeError, ValueError) as e:
+                    self._emit_audio_error(
+                        session,
                         {
                             "status": "error",
                             "message": f"Invalid audio data format: {str(e)}",
@@ -168,74 +261,159 @@ class STTStreamingController(STTControllerInterface):
                     )
                     return
 
-                self.use_case.add_audio_data(audio_bytes)
-
-            except Exception as e:
-                self.logger.error(f"Audio processing error: {str(e)}")
-                emit("error", {"status": "error", "message": str(e)})
-
-        @self.socketio.on("stop", namespace="/api/stt/stream")
-        def handle_stop():
-            client_id = self._get_client_id()
-
-            if client_id in self.active_sessions:
-                self.use_case.stop_streaming()
-                self.active_sessions[client_id]["streaming"] = False
-                self.logger.info(f"Streaming stopped for client {client_id}")
-                emit("stopped", {"status": "stopped", "message": "Streaming stopped"})
-
-    def transcribe_speech(self):
+            self.use_case.add_audio_data(audio_bytes)
+
+        except (AttributeError, TypeError, ValueError) as e:
+            self.logger.error("Audio processing error: %s", e)
+            self._emit_audio_error(session, {"status": "error", "message": str(e)})
+
+    def _emit_audio_error(
+        self, session: Optional[StreamingSession], payload: Dict[str, Any]
+    ) -> None:
+        # A client flooding bad frames would otherwise get one error event per
+        # frame. Each session has a token bucket refilled at ERROR_EMIT_RATE;
+        # errors beyond it are counted and reported with the next one sent.
+        if session is None:
+            emit("error", payload)
+            return
+
+        now = time.monotonic()
+        tokens = min(
+            self.ERROR_EMIT_BURST,
+            session.error_tokens
+            + (now - session.error_refilled_at) * self.ERROR_EMIT_RATE,
+        )
+        session.error_refilled_at = now
+        if tokens < 1.0:
+            session.error_tokens = tokens
+            session.suppressed_errors += 1
+            return
+
+        session.error_tokens = tokens - 1.0
+        if session.suppressed_errors:
+            payload = {**payload, "suppressed": session.suppressed_errors}
+            session.suppressed_errors = 0
+        emit("error", payload)
+
+    def _on_stop(self) -> None:
+        client_id = self._get_client_id()
+
+        with self._sessions_lock:
+            session = self.active_sessions.get(client_id)
+            if session is not None:
+                session.streaming = False
+
+        if session is not None:
+            self.use_case.stop_streaming()
+            self._cancel_streaming(session)
+            self.logger.info("Streaming stopped for client %s", client_id)
+            emit("stopped", _STOPPED_PAYLOAD)
+
+    def transcribe_speech(self) -> Tuple[Dict[str, Any], int]:
         return {"error": "Use streaming endpoint instead"}, 400
 
     def _get_client_id(self) -> str:
         try:
             return request.sid
-        except Exception:
+        except (AttributeError, RuntimeError):
             return "unknown"
 
-    def _start_streaming_thread(self, client_id: str, callback) -> None:
+    def _start_streaming(self, client_id: str, callback: ResultCallback) -> bool:
+        with self._sessions_lock:
+            session = self.active_sessions.get(client_id)
+            if session is None:
+                return False
+
+            # A stream past the pool size would wait for an executor thread
+            # while Google's audio timeout runs, so it is refused up front.
+            if self._active_streams >= self._max_streams:
+                session.configured = False
+                self.logger.error(
+                    "Rejecting stream for client %s: %d streams active",
+                    client_id,
+                    self._active_streams,
+                )
+                emit("error", _AT_CAPACITY_PAYLOAD)
+                return False
+
+            self._active_streams += 1
+            slot = _StreamSlot()
+            session.streaming = True
+            future = asyncio.run_coroutine_threadsafe(
+                self._run_stream(slot, callback), self._loop
+            )
+            session.future = future
+            session.slot = slot
+        future.add_done_callback(
+            lambda done: self._on_streaming_done(client_id, callback, slot, done)
+        )
+        return True
+
+    async def _run_stream(self, slot: _StreamSlot, callback: ResultCallback) -> None:
+        # The slot is held until start_streaming returns, which on cancel is
+        # only after its executor thread has finished with the gRPC call.
+        if slot.released:
+            return
+        slot.started = True
         try:
-            if client_id in self.active_sessions:
-                self.active_sessions[client_id]["streaming"] = True
-
-                import asyncio
-
-                try:
-
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                except RuntimeError:
-
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-
-                try:
-
-                    loop.run_until_complete(self.use_case.start_streaming(callback))
-                except Exception as e:
-                    self.logger.error(f"Error in streaming loop: {str(e)}")
-
-                    callback({"type": "error", "message": f"Streaming error: {str(e)}"})
-                finally:
-
-                    if client_id in self.active_sessions:
-                        self.active_sessions[client_id]["streaming"] = False
-                    try:
-                        loop.close()
-                    except:
-                        pass
-
-        except Exception as e:
-            self.logger.error(f"Streaming thread error: {str(e)}")
-            if client_id in self.active_sessions:
-                self.active_sessions[client_id]["streaming"] = False
-
-            callback(
-                {"type": "error", "message": f"Failed to start streaming: {str(e)}"}
+            await self.use_case.start_streaming(callback)
+        finally:
+            self._release_stream_slot(slot)
+
+    def _release_stream_slot(self, slot: _StreamSlot) -> None:
+        with self._sessions_lock:
+            if not slot.released:
+                slot.released = True
+                self._active_streams -= 1
+        slot.freed.set()
+
+    def _release_unstarted_slot(self, slot: _StreamSlot) -> None:
+        # Runs on the loop after a cancel: a task cancelled before its first
+        # step never enters _run_stream, so its slot is released here.
+        if not slot.started:
+            self._release_stream_slot(slot)
+
+    def _on_streaming_done(
+        self,
+        client_id: str,
+        callback: ResultCallback,
+        slot: _StreamSlot,
+        future: concurrent.futures.Future,
+    ) -> None:
+        with self._sessions_lock:
+            session = self.active_sessions.get(client_id)
+            # A stream that finishes while the session still expects it was
+            # ended by Google rather than by stop, disconnect or reconfigure.
+            ended_remotely = (
+                session is not None
+                and session.future is future
+                and session.streaming
+                and not future.cancelled()
             )
+            if session is not None and session.future is future:
+                session.streaming = False
+                if ended_remotely:
+                    session.configured = False
+
+        if future.cancelled():
+            self._loop.call_soon_threadsafe(self._release_unstarted_slot, slot)
+            return
+        error = future.exception()
+        if error is not None:
+            self.logger.error("Error in streaming loop: %s", error)
+            callback({"type": "error", "message": f"Streaming error: {str(error)}"})
+        if ended_remotely:
+            self.logger.info("Streaming ended for client %s", client_id)
+            callback(_STREAM_ENDED_PAYLOAD)
+
+    @staticmethod
+    def _is_streaming(session: StreamingSession) -> bool:
+        return session.future is not None and not session.future.done()
+
+    @staticmethod
+    def _cancel_streaming(session: StreamingSession) -> None:
+        if session.future is not None:
+            session.future.cancel()
 
 
 def register_routes(
@@ -1,16 +1,36 @@
-from typing import Any, Dict, Tuple
+import base64
+from typing import Any, Dict, Iterator, Tuple, Union
 
-from flask import Blueprint, make_response, request
-from marshmallow import Schema, ValidationError, fields
+from flask import Blueprint, Response, make_response, request, stream_with_context
+from marshmallow import ValidationError, fields
 
+from adapters.controllers.fast_schema import FastLoadSchema
 from adapters.loggers.logger_adapter import app_logger
 from app.api_response import ApiResponse
+from core.domain.exceptions import (
+    TTSException,
+    TTSProcessingError,
+    TTSValidationError,
+)
 from core.domain.tts_model import TTSRequest, VoiceConfig
 from core.interfaces.tts_controller_interface import TTSControllerInterface
 from usecases.synthesize_speech_use_case import SynthesizeSpeechUseCase
 
+_PREFLIGHT_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "Content-Type,Authorization",
+    "Access-Control-Allow-Methods": "GET,PUT,POST,DELETE,OPTIONS",
+}
 
-class TTSRequestSchema(Schema):
+_SSML_GENDERS = frozenset(
+    {"SSML_VOICE_GENDER_UNSPECIFIED", "MALE", "FEMALE", "NEUTRAL"}
+)
+
+# VoiceConfig is immutable, so requests without voiceConfig share one instance.
+_DEFAULT_VOICE = VoiceConfig()
+
+
+class TTSRequestSchema(FastLoadSchema):
     text = fields.String(required=True, validate=fields.Length(min=1, max=5000))
     voiceConfig = fields.Dict(keys=fields.String(), values=fields.Raw(), missing={})
 
@@ -18,32 +38,40 @@ class TTSRequestSchema(Schema):
 class TTSController(TTSControllerInterface):
     def __init__(self, use_case: SynthesizeSpeechUseCase) -> None:
         self.use_case = use_case
-
-    def synthesize_speech(self) -> Tuple[Dict[str, Any], int]:
-        try:
-            data = request.get_json() or {}
-            validated_data = TTSRequestSchema().load(data)
-
-            voice_config_data = validated_data["voiceConfig"]
+        self.schema = TTSRequestSchema()
+
+    def _parse_request(self) -> TTSRequest:
+        data = request.get_json() or {}
+        validated_data = self.schema.load(data)
+
+        voice_config_data = validated_data["voiceConfig"]
+        if not voice_config_data:
+            voice_config = _DEFAULT_VOICE
+        else:
+            ssml_gender = voice_config_data.get("ssmlGender", "NEUTRAL")
+            if ssml_gender not in _SSML_GENDERS:
+                raise ValidationError(
+                    {"voiceConfig": {"ssmlGender": ["Unknown SSML voice gender."]}}
+                )
             voice_config = VoiceConfig(
                 language_code=voice_config_data.get("languageCode", "en-US"),
                 name=voice_config_data.get("name", "en-US-Wavenet-D"),
-                ssml_gender=voice_config_data.get("ssmlGender", "NEUTRAL"),
+                ssml_gender=ssml_gender,
                 speaking_rate=voice_config_data.get("speakingRate", 1.0),
                 pitch=voice_config_data.get("pitch", 0.0),
             )
 
-            tts_request = TTSRequest(
-                text=validated_data["text"], voice_config=voice_config
-            )
+        return TTSRequest(text=validated_data["text"], voice_config=voice_config)
+
+    def synthesize_speech(self) -> Tuple[Dict[str, Any], int]:
+        try:
+            tts_request = self._parse_request()
 
             response = self.use_case.execute(tts_request)
 
             if response.success:
-                return (
-                    ApiResponse.success({"audioContent": response.audio_content}),
-                    200,
-                )
+                audio_b64 = base64.b64encode(response.audio_content).decode("ascii")
+                return ApiResponse.success({"audioContent": audio_b64}), 200
 
             app_logger.error("TTS synthesis failed: %s", response.error_message)
             return (
@@ -70,6 +98,51 @@ class TTSController(TTSControllerInterface):
             )
             return ApiResponse.error("Request processing failed"), 400
 
+    def synthesize_speech_stream(self) -> Union[Response, Tuple[Dict[str, Any], int]]:
+        try:
+            tts_request = self._parse_request()
+            chunks = self.use_case.execute_stream(tts_request)
+            # Synthesizing the first sentence before answering keeps request
+            # and credential errors as JSON responses with a proper status.
+            first_chunk = next(chunks, b"")
+
+        except ValidationError as validation_error:
+            app_logger.error("Request validation failed: %s", validation_error.messages)
+            return (
+                ApiResponse.error(
+                    "Validation error", details=validation_error.messages
+                ),
+                400,
+            )
+
+        except TTSValidationError as tts_error:
+            app_logger.error("TTS stream validation failed: %s", tts_error.message)
+            return ApiResponse.error(tts_error.message), 400
+
+        except TTSProcessingError as tts_error:
+            app_logger.error("TTS stream synthesis failed: %s", tts_error.message)
+            return ApiResponse.error(tts_error.message), 500
+
+        except (ValueError, TypeError) as processing_error:
+            app_logger.error(
+                "Processing error: %s", str(processing_error), exc_info=True
+            )
+            return ApiResponse.error("Request processing failed"), 400
+
+        return Response(
+            stream_with_context(self._stream_audio(first_chunk, chunks)),
+            mimetype="audio/mpeg",
+        )
+
+    @staticmethod
+    def _stream_audio(first_chunk: bytes, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        yield first_chunk
+        try:
+            yield from chunks
+        except TTSException as tts_error:
+            # Headers are already sent; the client sees a truncated stream.
+            app_logger.error("TTS stream aborted: %s", tts_error.message)
+
 
 def create_tts_blueprint(use_case: SynthesizeSpeechUseCase) -> Blueprint:
     blueprint = Blueprint("tts", __name__, url_prefix="/api/tts")
@@ -78,17 +151,14 @@ def create_tts_blueprint(use_case: SynthesizeSpeechUseCase) -> Blueprint:
     @blueprint.route("", methods=["POST", "OPTIONS"])
     def synthesize():
         if request.method == "OPTIONS":
-
-            response = make_response()
-            response.headers.add("Access-Control-Allow-Origin", "*")
-            response.headers.add(
-                "Access-Control-Allow-Headers", "Content-Type,Authorization"
-            )
-            response.headers.add(
-                "Access-Control-Allow-Methods", "GET,PUT,POST,DELETE,OPTIONS"
-            )
+            response = make_response("")
+            response.headers.update(_PREFLIGHT_HEADERS)
             return response
 
         return controller.synthesize_speech()
 
+    @blueprint.route("/stream", methods=["POST"])
+    def synthesize_stream():
+        return controller.synthesize_speech_stream()
+
     return blueprint
@@ -1,3 +1,5 @@
+import logging
+
 from config import Config
 from core.interfaces.logger_interface import ILogger
 from utils.logger import LoggerFactory
@@ -13,15 +15,21 @@ class LoggerAdapter(ILogger):
             log_to_file=getattr(config, "LOG_TO_FILE", False),
             log_file_path=getattr(config, "LOG_FILE_PATH", None),
         )
+        # isEnabledFor is answered from the logger's level cache, so a disabled
+        # level (debug in production) returns before the call is dispatched.
+        self._is_enabled = self._logger.isEnabledFor
 
     def debug(self, message: str, *args, **kwargs) -> None:
-        self._logger.debug(message, *args, **kwargs)
+        if self._is_enabled(logging.DEBUG):
+            self._logger.debug(message, *args, **kwargs)
 
     def info(self, message: str, *args, **kwargs) -> None:
-        self._logger.info(message, *args, **kwargs)
+        if self._is_enabled(logging.INFO):
+            self._logger.info(message, *args, **kwargs)
 
     def error(self, message: str, *args, **kwargs) -> None:
-        self._logger.error(message, *args, **kwargs)
+        if self._is_enabled(logging.ERROR):
+            self._logger.error(message, *args, **kwargs)
 
 
 app_logger = LoggerAdapter()
@@ -20,6 +20,7 @@ from app.handlers import (
     register_request_hooks,
     register_shutdown_handlers,
 )
+from app.json_provider import OrjsonProvider
 from app.routes import register_routes
 from config import Config, DevelopmentConfig, ProductionConfig
 from core.services.stt_domain_service import STTDomainService
@@ -58,6 +59,7 @@ class ApplicationFactory:
             config_class = cfg_map.get(env, DevelopmentConfig)
 
         flask_app = Flask(__name__)
+        flask_app.json = OrjsonProvider(flask_app)
         flask_app.config.from_object(config_class)
 
         register_extensions(flask_app)
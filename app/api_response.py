@@ -4,13 +4,9 @@ from typing import Any, Dict, Optional
 class ApiResponse:
     @staticmethod
     def success(data: Any = None, message: str = "Success") -> Dict[str, Any]:
-        response = {
-            "success": True,
-            "message": message,
-        }
-        if data is not None:
-            response["data"] = data
-        return response
+        if data is None:
+            return {"success": True, "message": message}
+        return {"success": True, "message": message, "data": data}
 
     @staticmethod
     def error(
@@ -18,6 +14,9 @@ class ApiResponse:
         details: Optional[Any] = None,
         error_code: Optional[str] = None,
     ) -> Dict[str, Any]:
+        if details is None and error_code is None:
+            return {"success": False, "message": message}
+
         response = {
             "success": False,
             "message": message,
@@ -1,3 +1,5 @@
+import socket
+
 from flask import Flask
 from flask_cors import CORS
 from flask_limiter import Limiter
@@ -5,10 +7,33 @@ from flask_limiter.util import get_remote_address
 from flask_socketio import SocketIO
 
 from adapters.loggers.logger_adapter import app_logger
+from app.json_provider import OrjsonSocketIOJSON
 
 socketio = SocketIO(async_mode="threading")
 
 
+class StreamingSocketMiddleware:
+    # Streaming results are small JSON frames; Nagle's algorithm would hold
+    # each one back waiting for the previous segment to be acknowledged.
+    # Audio frames are already Opus/PCM, so permessage-deflate would only
+    # spend a zlib pass per frame: dropping the client's extension offer
+    # keeps simple-websocket from negotiating it.
+    def __init__(self, wsgi_app, path_prefix: str = "/socket.io") -> None:
+        self.wsgi_app = wsgi_app
+        self.path_prefix = path_prefix
+
+    def __call__(self, environ, start_response):
+        if environ.get("PATH_INFO", "").startswith(self.path_prefix):
+            environ.pop("HTTP_SEC_WEBSOCKET_EXTENSIONS", None)
+            sock = environ.get("werkzeug.socket") or environ.get("gunicorn.socket")
+            if sock is not None:
+                try:
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                except (AttributeError, OSError):
+                    pass
+        return self.wsgi_app(environ, start_response)
+
+
 def register_extensions(app: Flask) -> None:
     if not app.config["TESTING"]:
 
@@ -51,8 +76,13 @@ def register_extensions(app: Flask) -> None:
         socketio_cors_origins = app.config["CORS_ORIGINS"]
 
     socketio.init_app(
-        app, cors_allowed_origins=socketio_cors_origins, async_mode="threading"
+        app,
+        cors_allowed_origins=socketio_cors_origins,
+        async_mode="threading",
+        json=OrjsonSocketIOJSON,
+        http_compression=False,
     )
+    app.wsgi_app = StreamingSocketMiddleware(app.wsgi_app)
 
     app_logger.debug("Extensions registered")
 
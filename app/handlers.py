@@ -5,6 +5,7 @@ from flask import Flask, g, jsonify, request
 from werkzeug.exceptions import HTTPException
 
 from adapters.loggers.logger_adapter import app_logger
+from utils.logger import LoggerFactory
 
 
 def register_error_handlers(app: Flask) -> None:
@@ -44,13 +45,13 @@ def register_error_handlers(app: Flask) -> None:
 def register_request_hooks(app: Flask) -> None:
     @app.before_request
     def before_request():
-        g.start_time = time.time()
+        g.start_time = time.perf_counter()
         app_logger.debug("Request started: %s %s", request.method, request.path)
 
     @app.after_request
     def after_request(response):
         if hasattr(g, "start_time"):
-            elapsed = time.time() - g.start_time
+            elapsed = time.perf_counter() - g.start_time
             app_logger.info(
                 "Request completed: %s %s - Status: %s - Time: %.4fs",
                 request.method,
@@ -64,5 +65,6 @@ def register_request_hooks(app: Flask) -> None:
 def register_shutdown_handlers(_app: Flask) -> None:
     def on_exit():
         app_logger.info("TTS Service Application is shutting down")
+        LoggerFactory.shutdown()
 
     atexit.register(on_exit)
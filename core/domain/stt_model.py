@@ -1,8 +1,8 @@
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class WordTimestamp:
     word: str
     start_time: float
@@ -11,7 +11,7 @@ class WordTimestamp:
 
 @dataclass
 class STTRequest:
-    audio_data: str
+    audio_data: Union[str, bytes]
     format: str = "webm"
     language: str = "en-US"
     enable_word_timestamps: bool = False
@@ -20,7 +20,9 @@ class STTRequest:
     model: str = "latest_long"
 
     def __post_init__(self) -> None:
-        if not self.audio_data.strip():
+        # Only base64 text is stripped; raw bytes are checked without a copy.
+        audio_data = self.audio_data
+        if not (audio_data.strip() if isinstance(audio_data, str) else audio_data):
             raise ValueError("Audio data cannot be empty")
         if self.format not in ["webm", "wav", "mp3", "flac", "opus"]:
             raise ValueError(f"Unsupported audio format: {self.format}")
@@ -28,7 +30,7 @@ class STTRequest:
             raise ValueError("Sample rate must be between 8000 and 48000 Hz")
 
 
-@dataclass
+@dataclass(slots=True)
 class STTResponse:
     transcription: str
     confidence: float
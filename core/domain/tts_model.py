@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VoiceConfig:
     language_code: str = "en-US"
     name: str = "en-US-Wavenet-D"
@@ -31,7 +31,7 @@ class TTSRequest:
 
 @dataclass
 class TTSResponse:
-    audio_content: str
+    audio_content: bytes
     success: bool
     error_message: Optional[str] = None
 
@@ -24,3 +24,7 @@ class GoogleSTTStreamingClientInterface(ABC):
     @abstractmethod
     def is_active(self) -> bool:
         raise NotImplementedError
+
+    @abstractmethod
+    def is_ingesting(self) -> bool:
+        raise NotImplementedError
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 from core.domain.tts_model import TTSRequest, TTSResponse
 
@@ -7,3 +8,7 @@ class GoogleTTSClientInterface(ABC):
     @abstractmethod
     def synthesize_speech(self, request: TTSRequest) -> TTSResponse:
         raise NotImplementedError
+
+    @abstractmethod
+    def synthesize_speech_stream(self, request: TTSRequest) -> Iterator[bytes]:
+        raise NotImplementedError
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 from core.domain.tts_model import TTSRequest, TTSResponse
 
@@ -8,3 +9,7 @@ class TTSDomainServiceInterface(ABC):
     def process_tts_request(self, request: TTSRequest) -> TTSResponse:
 
         raise NotImplementedError
+
+    @abstractmethod
+    def process_tts_stream(self, request: TTSRequest) -> Iterator[bytes]:
+        raise NotImplementedError
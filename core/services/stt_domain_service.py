@@ -23,7 +23,12 @@ class STTDomainService(STTDomainServiceInterface):
 
             return response
 
-        except (STTValidationError, STTProcessingError) as stt_error:
+        except STTValidationError:
+            # Bad client input is reported to the caller, not as a failed
+            # transcription, so the controller can answer with a 400.
+            raise
+
+        except STTProcessingError as stt_error:
 
             return STTResponse(
                 transcription="",
@@ -51,7 +56,8 @@ class STTDomainService(STTDomainServiceInterface):
             )
 
     def _validate_request(self, request: STTRequest) -> None:
-        if not request.audio_data.strip():
+        audio_data = request.audio_data
+        if not (audio_data.strip() if isinstance(audio_data, str) else audio_data):
             raise STTValidationError("Audio data cannot be empty")
 
         if request.format.lower() not in ["webm", "wav", "mp3", "flac", "opus"]:
@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from core.domain.exceptions import TTSProcessingError, TTSValidationError
 from core.domain.tts_model import TTSRequest, TTSResponse
 from core.interfaces.google_tts_client_interface import GoogleTTSClientInterface
@@ -26,7 +28,7 @@ class TTSDomainService(TTSDomainServiceInterface):
         except (TTSValidationError, TTSProcessingError) as tts_error:
 
             return TTSResponse(
-                audio_content="",
+                audio_content=b"",
                 success=False,
                 error_message=str(tts_error),
             )
@@ -34,7 +36,7 @@ class TTSDomainService(TTSDomainServiceInterface):
         except (ValueError, TypeError, AttributeError) as e:
 
             return TTSResponse(
-                audio_content="",
+                audio_content=b"",
                 success=False,
                 error_message=f"Processing error during TTS synthesis: {str(e)}",
             )
@@ -42,11 +44,17 @@ class TTSDomainService(TTSDomainServiceInterface):
         except (OSError, IOError, RuntimeError) as system_error:
 
             return TTSResponse(
-                audio_content="",
+                audio_content=b"",
                 success=False,
                 error_message=f"System error during TTS processing: {str(system_error)}",
             )
 
+    def process_tts_stream(self, request: TTSRequest) -> Iterator[bytes]:
+        # Validation errors surface before the first chunk is requested;
+        # synthesis errors are raised as TTSProcessingError while iterating.
+        self._validate_request(request)
+        return self.google_client.synthesize_speech_stream(request)
+
     def _validate_request(self, request: TTSRequest) -> None:
         if not request.text.strip():
             raise TTSValidationError("Text cannot be empty")
@@ -0,0 +1,23 @@
+import unittest
+
+from marshmallow import ValidationError, fields
+
+from adapters.controllers.fast_schema import FastLoadSchema
+
+
+class FloatSchema(FastLoadSchema):
+    value = fields.Float(missing=1.0)
+
+
+class FastLoadFloatTest(unittest.TestCase):
+    def test_finite_float_loads(self):
+        self.assertEqual(FloatSchema().load({"value": 2.5}), {"value": 2.5})
+
+    def test_non_finite_float_is_rejected(self):
+        for value in (float("nan"), float("inf"), float("-inf")):
+            with self.assertRaises(ValidationError):
+                FloatSchema().load({"value": value})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import concurrent.futures
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from adapters.controllers import stt_streaming_controller
+from adapters.controllers.stt_streaming_controller import (
+    STTStreamingController,
+    StreamingSession,
+    _StreamSlot,
+)
+
+
+class FakeSocketIO:
+    def __init__(self):
+        self.handlers = {}
+
+    def on_event(self, event, handler, namespace=None):
+        self.handlers[event] = handler
+
+
+class AudioFrameTest(unittest.TestCase):
+    def setUp(self):
+        self.use_case = mock.Mock()
+        self.use_case.is_ingesting.return_value = True
+        self.controller = STTStreamingController(
+            FakeSocketIO(), self.use_case, max_streams=1
+        )
+        self.controller.active_sessions["sid"] = StreamingSession(configured=True)
+        self.emitted = []
+        for target, value in (
+            ("emit", lambda event, data=None, **kw: self.emitted.append(data)),
+            ("request", SimpleNamespace(sid="sid")),
+        ):
+            patcher = mock.patch.object(stt_streaming_controller, target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_int_list_is_converted(self):
+        self.controller._on_audio({"data": [1, 2, 3]})
+        self.use_case.add_audio_data.assert_called_once_with(b"\x01\x02\x03")
+
+    def test_int_payload_is_rejected(self):
+        self.controller._on_audio({"data": 10**9})
+        self.use_case.add_audio_data.assert_not_called()
+        self.assertIn("Invalid audio data format", self.emitted[-1]["message"])
+
+    def test_str_payload_is_rejected(self):
+        self.controller._on_audio({"data": "AAEC"})
+        self.use_case.add_audio_data.assert_not_called()
+        self.assertIn("Invalid audio data format", self.emitted[-1]["message"])
+
+
+class StreamEndTest(unittest.TestCase):
+    def setUp(self):
+        self.controller = STTStreamingController(
+            FakeSocketIO(), mock.Mock(), max_streams=1
+        )
+        self.future = concurrent.futures.Future()
+        self.session = StreamingSession(
+            configured=True, streaming=True, future=self.future
+        )
+        self.controller.active_sessions["sid"] = self.session
+        self.results = []
+
+    def test_remote_end_is_reported(self):
+        self.future.set_result(None)
+        self.controller._on_streaming_done(
+            "sid", self.results.append, _StreamSlot(), self.future
+        )
+        self.assertEqual(self.results[-1]["type"], "stream_ended")
+        self.assertFalse(self.session.configured)
+
+    def test_client_stop_is_not_reported(self):
+        self.session.streaming = False
+        self.future.set_result(None)
+        self.controller._on_streaming_done(
+            "sid", self.results.append, _StreamSlot(), self.future
+        )
+        self.assertEqual(self.results, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,3 @@
-import asyncio
 from typing import Any, Callable, Dict
 
 from core.interfaces.google_stt_streaming_client_interface import (
@@ -17,13 +16,7 @@ class STTStreamingUseCase(UseCaseInterface):
     async def start_streaming(
         self, result_callback: Callable[[Dict[str, Any]], None]
     ) -> None:
-        async def async_callback(result: Dict[str, Any]) -> None:
-            if asyncio.iscoroutinefunction(result_callback):
-                await result_callback(result)
-            else:
-                result_callback(result)
-
-        await self.streaming_client.start_streaming(async_callback)
+        await self.streaming_client.start_streaming(result_callback)
 
     def add_audio_data(self, audio_data: bytes) -> None:
         self.streaming_client.add_audio_chunk(audio_data)
@@ -33,3 +26,6 @@ class STTStreamingUseCase(UseCaseInterface):
 
     def is_streaming_active(self) -> bool:
         return self.streaming_client.is_active()
+
+    def is_ingesting(self) -> bool:
+        return self.streaming_client.is_ingesting()
@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from core.domain.tts_model import TTSRequest, TTSResponse
 from core.interfaces.tts_domain_service_interface import TTSDomainServiceInterface
 from core.interfaces.use_case_interfaces import UseCaseInterface
@@ -9,3 +11,6 @@ class SynthesizeSpeechUseCase(UseCaseInterface):
 
     def execute(self, request: TTSRequest) -> TTSResponse:
         return self.service.process_tts_request(request)
+
+    def execute_stream(self, request: TTSRequest) -> Iterator[bytes]:
+        return self.service.process_tts_stream(request)
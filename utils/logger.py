@@ -1,5 +1,6 @@
 import logging
 import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Dict, Optional, Union
@@ -9,6 +10,7 @@ from config import Config
 
 class LoggerFactory:
     _loggers: Dict[str, logging.Logger] = {}
+    _listeners: Dict[str, logging.handlers.QueueListener] = {}
 
     @classmethod
     def get_logger(
@@ -63,9 +65,25 @@ class LoggerFactory:
             except (OSError, PermissionError, FileNotFoundError) as e:
                 logger.warning("Failed to set up file logging: %s", e)
 
+        # Callers only enqueue records; formatting output and writing to
+        # stdout or disk happen on the listener thread.
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            log_queue, *logger.handlers, respect_handler_level=True
+        )
+        logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+        listener.start()
+
+        cls._listeners[name] = listener
         cls._loggers[name] = logger
         return logger
 
+    @classmethod
+    def shutdown(cls) -> None:
+        while cls._listeners:
+            _, listener = cls._listeners.popitem()
+            listener.stop()
+
 
 def setup_logger(config=None):
     if config is None: